@@ -1,7 +1,12 @@
 import pandas
 import numpy
 import collections
+import concurrent.futures
+import functools
+import hashlib
+import os
 import prognosec.timeseries as timeseries
+from progutils import progutils
 from statsmodels.tsa.arima_model import ARIMA
 import abc
 import typing as ty
@@ -9,6 +14,19 @@ import typing as ty
 
 ONEBDAY = pandas.tseries.offsets.BusinessDay(1)
 
+# Fitted ARIMA results, keyed on the model order and a fingerprint of the
+# data, so identical fits (e.g. repeated cross validation) are not rerun.
+# Off by default: each entry keeps a full `ARIMAResults` alive, including its
+# training data. Set to a positive number of entries to turn it on
+ARIMA_FIT_CACHE_SIZE = 0
+_ARIMA_FIT_CACHE = collections.OrderedDict()
+
+# Column names and types of the `cv_timeseries` output
+_CV_COLUMNS = (('k', numpy.int64), ('series', object), ('model', object),
+               ('train_size', numpy.int64), ('test_size', numpy.int64),
+               ('mse', numpy.float64), ('var', numpy.float64),
+               ('AIC', numpy.float64), ('BIC', numpy.float64))
+
 
 class Model(abc.ABC):
     """Abstract Model class
@@ -30,12 +48,30 @@ class Model(abc.ABC):
         The timeseries dataset containing the time series for forecasting
         and exogenous/independent variables
     """
+    # Many models are created during cross validation, so skip the
+    # per-instance `__dict__`
+    __slots__ = ('_ts', '_params', '_models', '_fit_keys', '_series_idx',
+                 '_aic', '_bic', '_llf', '_converged', '_fit_id',
+                 '_summary_cache', '_model_name_prefix', '_model_version',
+                 '_package')
+
     @abc.abstractmethod
     def __init__(self, ts: ty.Optional[timeseries.Timeseries] = None):
         self._ts = ts
         self._params = ModelParameters()
         self._models = dict()
-        self._model_fit_converge = dict()
+        self._fit_keys = dict()
+
+        # Fit statistics, stored by position in `_series_idx`
+        self._series_idx = dict()
+        self._aic = numpy.empty(0, dtype=numpy.float64)
+        self._bic = numpy.empty(0, dtype=numpy.float64)
+        self._llf = numpy.empty(0, dtype=numpy.float64)
+        self._converged = numpy.empty(0, dtype=bool)
+
+        # Summaries keyed on (series, `_fit_id`), `_fit_id` changes per fit
+        self._fit_id = 0
+        self._summary_cache = dict()
 
         self._model_name_prefix = ''
         self._model_version = 1
@@ -117,16 +153,17 @@ class Model(abc.ABC):
             more information about how it is set up
         """
         self._params.set_parameters(series, param)
+        self._summary_cache.clear()
 
     @params.setter
     @abc.abstractproperty
     def params(self, params):
         pass
-        # if isinstance(params, dict) is not True:
+        # if not isinstance(params, dict):
         #     raise TypeError("'params' must be of type dict")
         # if len(params) != len(self._params):
         #     raise ValueError(f"len(params) does is not {len(self._params)}")
-        # if len(set([len(i) for i in params.values()])) is not True:
+        # if len({len(i) for i in params.values()}) != 1:
         #     raise ValueError("All series in 'params' is not correct")
 
         # self._params = params
@@ -144,7 +181,8 @@ class Model(abc.ABC):
 
     @abc.abstractmethod
     def fit(self, tsobj: ty.Optional[timeseries.Timeseries] = None,
-            append: ty.Optional[bool] = False):
+            append: ty.Optional[bool] = False,
+            force: ty.Optional[bool] = False):
         """Fit a `Timeseries` to the model
 
         Parameters
@@ -155,6 +193,9 @@ class Model(abc.ABC):
         append : bool
             If `True`, the provided `Timeseries` will be appended to the
             internally stored `Timeseries`
+        force : bool
+            If `True`, every series is refitted. Otherwise series whose data
+            and parameters are unchanged since the last fit are not refitted
         """
         pass
 
@@ -206,9 +247,10 @@ class Model(abc.ABC):
         """
         series = self.pseries if series is None else series
 
-        diff = self.fitted(series) - self.ts.get_series_pandas(series)
+        mse, _ = progutils.squared_error_stats(
+            self.fitted(series), self.ts.get_series_pandas(series))
 
-        return diff.dropna().pow(2).mean()
+        return mse
 
     @abc.abstractmethod
     def aic(self, series: ty.Optional[str] = None) -> float:
@@ -284,22 +326,16 @@ class Model(abc.ABC):
             - lower: the lower limit of the confidence interval
             - upper: the upper limit of the confidence interval
         """
-        q_nperiods = nperiods
         series = self._ts.primary_series if series is None else series
 
-        while True:
-            new_dti = self._ts.periods.shift(q_nperiods)[-q_nperiods:]
-            new_dti = self._ts._calendar.valid_days(new_dti[0], new_dti[-1],
-                                                    tz=self._ts.timezone)
-
-            if len(new_dti) != nperiods:
-                q_nperiods += 1
-            else:
-                break
+        periods = self._ts.periods
+        new_dti = _forecast_index(self._ts._calendar,
+                                  periods[-1] + periods.freq, nperiods,
+                                  self._ts.timezone)
 
         result = self._model_forecast(nperiods, series)
-        result.index = new_dti
-        result.index.name = self.ts.periods.name
+        # Rename a copy, the index is shared by the `_forecast_index` cache
+        result.index = new_dti.rename(periods.name)
 
         return timeseries.Timeseries(result, series, self.ts._calendar,
                                      self.ts._na_strategy)
@@ -342,11 +378,11 @@ class Model(abc.ABC):
         nperiods = len(test_ds.X)
 
         forecasted_series = self.forecast(nperiods, series)
-        diff = (forecasted_series.get_series_pandas(series) -
-                test_ds.get_series_pandas(series))
-        squared_error = diff.dropna().pow(2)
+        mse, var = progutils.squared_error_stats(
+            forecasted_series.get_series_pandas(series),
+            test_ds.get_series_pandas(series))
 
-        return {'mse': squared_error.mean(), 'var': squared_error.var()}
+        return {'mse': mse, 'var': var}
 
 
 class Arima(Model):
@@ -374,26 +410,27 @@ class Arima(Model):
     ts : timeseries.Timeseries
         The timeseries dataset containing the time series for forecasting
         and exogenous/independent variables
+    n_jobs : int, optional
+        Number of worker processes used to fit the series in parallel. If
+        `None` or `1`, series are fitted sequentially. If `-1`, one worker per
+        CPU is used
     """
+    __slots__ = ('_order', '_n_jobs')
 
     def __init__(self, order: ty.Sequence[int],
-                 ts: ty.Optional[timeseries.Timeseries] = None):
-        self._ts = ts
-        self._params = ModelParameters()
-        self._models = dict()
-        self._model_fit_converge = dict()
+                 ts: ty.Optional[timeseries.Timeseries] = None,
+                 n_jobs: ty.Optional[int] = None):
+        # Fit only once the ARIMA attributes are set, `fit` also sets the
+        # parameters of each series from `order`
+        super().__init__(ts=None)
 
         self._model_name_prefix = 'ARIMA'
-        self._model_version = 1
         self._package = 'statsmodels'
         self._order = order
+        self._n_jobs = n_jobs
 
         if ts is not None:
-            for a_series in ts.series:
-                self._params.set_parameters(a_series, order)
-
-        if self._ts is not None:
-            self.fit(self._ts)
+            self.fit(ts)
 
     def model_name(self, series: ty.Optional[str] = None) -> str:
         series = self.pseries if series is None else series
@@ -404,9 +441,11 @@ class Arima(Model):
     @Model.params.setter
     def params(self, params):
         self._params = params
+        self._summary_cache.clear()
 
     def fit(self, tsobj: ty.Optional[timeseries.Timeseries] = None,
-            append: ty.Optional[bool] = False):
+            append: ty.Optional[bool] = False,
+            force: ty.Optional[bool] = False):
         if self._ts is None and tsobj is None:
             raise ValueError("`X` is not set")
 
@@ -415,20 +454,65 @@ class Arima(Model):
                 self._params.set_parameters(a_series, self._order)
 
         if tsobj is not None:
-            if append is False:
+            if not append:
                 self._ts = tsobj
             else:
                 self._ts.append(tsobj)
 
-        for a_series in self._ts.series:
-            mod = ARIMA(self._ts.X[[a_series]],
-                        self._params.get_parameters(a_series))
-
-            self._models[a_series] = mod.fit()
-
-            did_model_converge = self._models[a_series].mle_retvals
-            did_model_converge = did_model_converge['converged']
-            self._model_fit_converge[a_series] = did_model_converge
+        series_names = list(self._ts.series)
+        series_data = [self._ts.X[[i]] for i in series_names]
+        series_orders = [self._params.get_parameters(i) for i in series_names]
+        fit_keys = [_fit_key(data, order)
+                    for data, order in zip(series_data, series_orders)]
+
+        # Only series without a previously fitted model are fitted. This
+        # model's own fits are checked first, then the shared cache
+        fit_results = dict()
+        if not force:
+            for a_series, key in zip(series_names, fit_keys):
+                if self._fit_keys.get(a_series) == key:
+                    series_idx = self._series_idx[a_series]
+                    fit_results[key] = (self._models[a_series],
+                                        self._converged[series_idx])
+                elif key in _ARIMA_FIT_CACHE:
+                    fit_results[key] = _cached_fit_result(key)
+
+        to_fit = [i for i, key in enumerate(fit_keys)
+                  if key not in fit_results]
+        to_fit_data = [series_data[i] for i in to_fit]
+        to_fit_orders = [series_orders[i] for i in to_fit]
+        max_workers = _num_workers(self._n_jobs, len(to_fit))
+
+        if max_workers == 1:
+            new_results = map(_fit_arima, to_fit_data, to_fit_orders)
+            new_results = list(new_results)
+        else:
+            # Each fit is an independent, CPU-bound MLE optimization
+            with concurrent.futures.ProcessPoolExecutor(max_workers) as pool:
+                new_results = pool.map(_fit_arima, to_fit_data, to_fit_orders)
+                new_results = list(new_results)
+
+        for i, a_fit_result in zip(to_fit, new_results):
+            fit_results[fit_keys[i]] = a_fit_result
+            _cache_fit_result(fit_keys[i], a_fit_result)
+
+        fit_results = [fit_results[key] for key in fit_keys]
+        for a_series, (fitted_model, _) in zip(series_names, fit_results):
+            self._models[a_series] = fitted_model
+
+        fitted_models = [fitted_model for fitted_model, _ in fit_results]
+        self._fit_keys = dict(zip(series_names, fit_keys))
+        self._series_idx = {name: i for i, name in enumerate(series_names)}
+        self._aic = numpy.array([i.aic for i in fitted_models],
+                                dtype=numpy.float64)
+        self._bic = numpy.array([i.bic for i in fitted_models],
+                                dtype=numpy.float64)
+        self._llf = numpy.array([i.llf for i in fitted_models],
+                                dtype=numpy.float64)
+        self._converged = numpy.array([i for _, i in fit_results], dtype=bool)
+
+        self._fit_id += 1
+        self._summary_cache.clear()
 
     def fitted(self, series: ty.Optional[str] = None) -> ty.Sequence[float]:
         series = self.pseries if series is None else series
@@ -436,14 +520,44 @@ class Arima(Model):
         return self._models[series].predict(typ='levels')
 
     def summary(self, series: ty.Optional[str] = None) -> ty.Dict:
+        """Gather a summary of model statistics
+
+        Summaries are cached per series until the model is refitted, its
+        parameters are replaced through `change_parameter` or `params`, or
+        the number of observations in `ts` changes. Editing the values of
+        `ts` in place, or the `ModelParameters` returned by `params`,
+        without refitting is not detected, and the cached summary is
+        returned.
+
+        Parameters
+        ----------
+        series : str, optional
+            Name of the series. If `None`, will use the primary series
+
+        Returns
+        -------
+        dict
+            Keyed on name and valued on the various statistics and other
+            model information
+        """
         series = self.pseries if series is None else series
 
+        # `mse` re-traverses the fitted values, so build once per fit.
+        # `# of Obs.` and `MSE` read `ts`, so appending to it is a new key
+        key = (series, self._fit_id, len(self._ts.X))
+        if key not in self._summary_cache:
+            self._summary_cache[key] = self._build_summary(series)
+
+        return self._summary_cache[key].copy()
+
+    def _build_summary(self, series: str) -> ty.Dict:
         output = collections.OrderedDict()
         output['Dependent'] = series
         output["Model"] = self.model_name(series)
         output['# of Obs.'] = len(self._ts.X)
-        output['Model Converged'] = self._model_fit_converge[series]
-        output['Log Likelihood'] = self._models[series].llf
+        output['Model Converged'] = bool(
+            self._converged[self._series_idx[series]])
+        output['Log Likelihood'] = self._llf[self._series_idx[series]]
         output['AIC'] = self.aic(series)
         output['BIC'] = self.bic(series)
         output['MSE'] = self.mse(series)
@@ -453,12 +567,12 @@ class Arima(Model):
     def aic(self, series: ty.Optional[str] = None) -> float:
         series = self.pseries if series is None else series
 
-        return self._models[series].aic
+        return self._aic[self._series_idx[series]]
 
     def bic(self, series: ty.Optional[str] = None) -> float:
         series = self.pseries if series is None else series
 
-        return self._models[series].bic
+        return self._bic[self._series_idx[series]]
 
     def _model_forecast(self, nperiods: int,
                         series: ty.Optional[str] = None) -> pandas.DataFrame:
@@ -471,20 +585,24 @@ class Arima(Model):
         - upper: the upper limit of the confidence interval
         """
         results = self._models[series].forecast(nperiods)
+        # `results[2]` is the (nperiods, 2) confidence interval array
         result = {
             series: results[0],
             'se': results[1],
-            'lower': [i[0] for i in results[2]],
-            'upper': [i[1] for i in results[2]]
+            'lower': results[2][:, 0],
+            'upper': results[2][:, 1]
         }
-        result = pandas.DataFrame.from_dict(result)
+        result = pandas.DataFrame(result)
 
         return result
 
 
 class RandomWalk(Arima):
-    def __init__(self, ts: ty.Optional[timeseries.Timeseries] = None):
-        super().__init__((0, 1, 0), ts)
+    __slots__ = ()
+
+    def __init__(self, ts: ty.Optional[timeseries.Timeseries] = None,
+                 n_jobs: ty.Optional[int] = None):
+        super().__init__((0, 1, 0), ts, n_jobs)
 
 
 class ModelParameters:
@@ -507,16 +625,18 @@ class ModelParameters:
         Names of parameters. If provided, this determines the size of the
         arrays that stores the parameters
     """
+    __slots__ = ('_series_names', '_param_names', '_params')
 
     def __init__(self, series_names=None, param_names=None):
         self._series_names = series_names
         self._param_names = param_names
 
-        self._params = collections.OrderedDict()
-
+        # Plain dicts keep insertion order and are cheaper to index than an
+        # OrderedDict, which matters as parameters are read on every fit
         if series_names is not None:
-            for serie_name in series_names:
-                self._params[serie_name] = None
+            self._params = dict.fromkeys(series_names)
+        else:
+            self._params = dict()
 
     @property
     def series_names(self):
@@ -571,30 +691,211 @@ class ModelParameters:
         return self._params[series]
 
 
-def cv_timeseries(time_series, model, series=None, k=10, **kwargs):
+@functools.lru_cache(maxsize=1024)
+def _forecast_index(calendar, start, nperiods, tz):
+    """Index of the first `nperiods` valid days on or after `start`
+
+    Cached, as the same forecast horizon is requested repeatedly during
+    cross validation.
+
+    Parameters
+    ----------
+    calendar : pandas_market_calendars.MarketCalendar
+        Calendar that determines the valid days
+    start : pandas.Timestamp
+        The first candidate day, typically one period after the last
+        observed period
+    nperiods : int
+        Number of valid days to return
+    tz : str, datetime.tzinfo
+        Time zone of the returned index
+
+    Returns
+    -------
+    pandas.DatetimeIndex
+    """
+    # Roughly two calendar days per valid day, widened until it is enough
+    search_span = pandas.Timedelta(days=2 * nperiods + 7)
+    end = start + search_span
+
+    while True:
+        new_dti = calendar.valid_days(start, end, tz=tz)
+
+        if len(new_dti) >= nperiods:
+            return new_dti[:nperiods]
+
+        end = end + search_span
+
+
+def _fit_arima(data, order):
+    """Fit an ARIMA model on a single series
+
+    Defined at the module level so it can be sent to worker processes.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        Single column data frame of the series
+    order : array_like[int]
+        The (p, d, q) order of the ARIMA model
+
+    Returns
+    -------
+    tuple
+        The fitted model results and whether the fit converged
+    """
+    fitted_model = ARIMA(data, order).fit()
+
+    return fitted_model, fitted_model.mle_retvals['converged']
+
+
+def _fit_key(data, order):
+    """Cache key for fitting an ARIMA model of `order` on `data`
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        Single column data frame of the series
+    order : array_like[int]
+        The (p, d, q) order of the ARIMA model
+
+    Returns
+    -------
+    tuple
+        The order, column names, and a digest of the values and index
+    """
+    data_hash = pandas.util.hash_pandas_object(data, index=True).to_numpy()
+    data_hash = hashlib.sha1(data_hash.tobytes()).hexdigest()
+
+    return tuple(order), tuple(data.columns), data_hash
+
+
+def _cached_fit_result(key):
+    """Retrieve a cached fit result, marking it as most recently used"""
+    _ARIMA_FIT_CACHE.move_to_end(key)
+
+    return _ARIMA_FIT_CACHE[key]
+
+
+def _cache_fit_result(key, fit_result):
+    """Store a fit result, evicting the least recently used if full"""
+    if ARIMA_FIT_CACHE_SIZE <= 0:
+        return
+
+    _ARIMA_FIT_CACHE[key] = fit_result
+
+    while len(_ARIMA_FIT_CACHE) > ARIMA_FIT_CACHE_SIZE:
+        _ARIMA_FIT_CACHE.popitem(last=False)
+
+
+def clear_fit_cache():
+    """Remove all cached ARIMA fit results
+
+    The cache is only used when `ARIMA_FIT_CACHE_SIZE` is positive. Every
+    entry holds a fitted `ARIMAResults`, with its training data, until it is
+    evicted or cleared, so clear it once repeated fits are done.
+    """
+    _ARIMA_FIT_CACHE.clear()
+
+
+def _num_workers(n_jobs, n_tasks):
+    """Number of worker processes to use for `n_tasks` independent tasks
+
+    Parameters
+    ----------
+    n_jobs : int, None
+        Requested number of workers. `None` means one, and negative values
+        count back from the number of CPUs (e.g. `-1` is all CPUs)
+    n_tasks : int
+        Number of tasks to be run
+
+    Returns
+    -------
+    int
+        Always at least one, and never more than `n_tasks`
+    """
+    if n_jobs is None:
+        n_jobs = 1
+    elif n_jobs < 0:
+        n_jobs = (os.cpu_count() or 1) + 1 + n_jobs
+
+    return max(1, min(n_jobs, n_tasks))
+
+
+def _cv_fold(kth, ds, model, series, model_kwargs):
+    """Fit and score a model on one cross validation fold
+
+    Defined at the module level so it can be sent to worker processes.
+
+    Returns
+    -------
+    tuple
+        The fold's record for `cv_timeseries`, ordered as `_CV_COLUMNS`
+    """
+    mod = model(**model_kwargs)
+    mod.fit(ds[0])
+
+    split_stats = mod.fit_forecast(ds[1], series=series)
+    rec = (kth, mod._ts.primary_series, mod.model_name(series),
+           len(ds[0].X), len(ds[1].X),
+           split_stats['mse'], split_stats['var'],
+           mod.aic(series), mod.bic(series))
+
+    return rec
+
+
+def cv_timeseries(time_series, model, series=None, k=10, fold_jobs=None,
+                  **kwargs):
+    """Cross validate a model over the folds of `time_series.split()`
+
+    Parameters
+    ----------
+    time_series : timeseries.Timeseries
+        The time series to be split into train and test sets
+    model : type
+        The `Model` subclass to be fitted on each fold
+    series : str, optional
+        Name of the series. If `None`, will use the primary series
+    k : int
+        The maximum number of folds to use. Folds are taken in order from
+        `time_series.split()`, this does not change how the data is split
+    fold_jobs : int, optional
+        Number of worker processes used to run the folds in parallel. If
+        `None` or `1`, folds are run sequentially. If `-1`, one worker per
+        CPU is used. Named apart from the model's own `n_jobs`, which can
+        still be given in `kwargs`
+    kwargs
+        Passed on to `model` when it is created for each fold
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per fold with the fold's test MSE and variance, and the
+        model's AIC and BIC
+    """
     # TODO deal with this
-    # if isinstance(time_series, timeseries.Timeseries) is not True:
+    # if not isinstance(time_series, timeseries.Timeseries):
     #     raise TypeError("'time_series' is not a Timeseries object")
 
-    output = list()
-    for ds, kth in zip(time_series.split(), range(10)):
-        mod = model(**kwargs)
-        mod.fit(ds[0])
-
-        split_stats = mod.fit_forecast(ds[1], series=series)
-        rec = {
-            'k': kth, 'series': mod._ts.primary_series,
-            'model': mod.model_name(series),
-            'train_size': len(ds[0].X),
-            'test_size': len(ds[1].X),
-            'mse': split_stats['mse'], 'var': split_stats['var'],
-            'AIC': mod.aic(series),
-            'BIC': mod.bic(series)}
-
-        output.append(rec)
-
-    col_headers = ['k', 'series', 'model', 'train_size', 'test_size', 'mse',
-                   'var', 'AIC', 'BIC']
-    output = pandas.DataFrame.from_records(output, columns=col_headers)
+    folds = zip(range(k), time_series.split())
+    fold_args = ((kth, ds, model, series, kwargs) for kth, ds in folds)
+
+    # Folds are independent, so they can be fitted in separate processes.
+    # Sequential runs take one fold at a time from `split`
+    max_workers = _num_workers(fold_jobs, k)
+    if max_workers == 1:
+        records = [_cv_fold(*i) for i in fold_args]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as pool:
+            futures = [pool.submit(_cv_fold, *i) for i in fold_args]
+            records = [i.result() for i in futures]
+
+    # Transpose the records into one typed array per column
+    col_values = zip(*records) if records else [()] * len(_CV_COLUMNS)
+    col_headers = [colname for colname, _ in _CV_COLUMNS]
+
+    output = {colname: numpy.array(values, dtype=coltype)
+              for (colname, coltype), values in zip(_CV_COLUMNS, col_values)}
+    output = pandas.DataFrame(output, columns=col_headers)
 
     return output
@@ -15,70 +15,67 @@ functions starting with `fillnan` is s `NaN` fill function
 
 
 class TransformationFunction:
-    def __init__(self, func, name, params=None):
+    def __init__(self, func, name, params=None, elementwise=False):
         self._func = func
         self._name = name
         self._params = params
+        # Elementwise functions can be applied to a 2-D array of many series
+        # in one call. See `Transformation.apply_batch`
+        self._elementwise = elementwise
+
+        # Name and parameters are fixed after init, so build the string
+        # representations once
+        if params is None:
+            self._str = name + "()"
+        else:
+            funname_params = [k + "=" + str(v) for k, v in params.items()]
+            funname_params = ", ".join(funname_params)
+
+            self._str = name + "(" + funname_params + ")"
+
+        self._repr = f"<{type(self).__name__}: {self._str}>"
 
     @property
     def name(self):
         return self._name
 
+    @property
+    def elementwise(self):
+        return self._elementwise
+
     def __call__(self, *args, **kwargs):
         return self._func(*args, **kwargs)
 
     def __str__(self):
-        if self._params is None:
-            output = self._name + "()"
-        else:
-            params_values = self._params.items()
-            funname_params = [k + "=" + str(v) for k, v in params_values]
-            funname_params = ", ".join(funname_params)
-            funname_params = "(" + funname_params + ")"
-
-            output = self._name + funname_params
-
-        return output
+        return self._str
 
     def __repr__(self):
-        return f"<TransformationFunction: {self.__str__()}>"
+        return self._repr
 
 
 class MissingValueFillFunction(TransformationFunction):
     def __init__(self, func, name, params=None):
         super().__init__(func, name, params=params)
 
-    def __repr__(self):
-        return f"<MissingValueFillFunction: {self.__str__()}>"
-
 
 class AggregateFunction(TransformationFunction):
     def __init__(self, func, name, params=None):
         super().__init__(func, name, params=params)
 
-    def __repr__(self):
-        return f"<AggregateFunction: {self.__str__()}>"
-
 
 class DownsampleFunction(TransformationFunction):
     def __init__(self, func, name, params=None):
         super().__init__(func, name, params=params)
 
-    def __repr__(self):
-        return f"<DownsampleFunction: {self.__str__()}>"
-
 
 class UpsampleFunction(TransformationFunction):
     def __init__(self, func, name, params=None):
         super().__init__(func, name, params=params)
 
-    def __repr__(self):
-        return f"<UpsampleFunction: {self.__str__()}>"
-
 
 def trans_log():
     func = functools.partial(numpy.log)
-    output_func = TransformationFunction(func, 'ln')
+    output_func = TransformationFunction(func, 'ln', elementwise=True)
 
     return output_func
 
@@ -89,28 +86,28 @@ def trans_ln():
 
 def trans_log10():
     func = functools.partial(numpy.log10)
-    output_func = TransformationFunction(func, 'log10')
+    output_func = TransformationFunction(func, 'log10', elementwise=True)
 
     return output_func
 
 
 def trans_log1p():
     func = functools.partial(numpy.log1p)
-    output_func = TransformationFunction(func, 'log1p')
+    output_func = TransformationFunction(func, 'log1p', elementwise=True)
 
     return output_func
 
 
 def trans_log2():
     func = functools.partial(numpy.log2)
-    output_func = TransformationFunction(func, 'log2')
+    output_func = TransformationFunction(func, 'log2', elementwise=True)
 
     return output_func
 
 
 def trans_sqrt():
     func = functools.partial(numpy.sqrt)
-    output_func = TransformationFunction(func, 'sqrt')
+    output_func = TransformationFunction(func, 'sqrt', elementwise=True)
 
     return output_func
 
@@ -158,17 +155,32 @@ def trans_shift(shift=1):
 
 def trans_inverse(add=0):
     def inverse(x, add=add):
-        if progutils.is_tuple_or_list(x):
-            x = numpy.array(x)
+        # Scalars, pandas objects, etc. keep their own arithmetic and type
+        if not (isinstance(x, numpy.ndarray) or
+                progutils.is_tuple_or_list(x)):
+            return 1 / (x + add)
+
+        output = numpy.asarray(x)
+
+        # Only one new array is allocated, and the reciprocal is taken in
+        # place on it. Float input keeps its dtype
+        if numpy.issubdtype(output.dtype, numpy.inexact):
+            output = output + add
+        else:
+            output = output.astype(numpy.float64)
+            output += add
 
-        return 1 / (x + add)
+        numpy.reciprocal(output, out=output)
+
+        return output
 
     func = functools.partial(inverse)
 
     param_dict = collections.OrderedDict()
     param_dict['add'] = add
 
-    output_func = TransformationFunction(func, 'inverse', param_dict)
+    output_func = TransformationFunction(func, 'inverse', param_dict,
+                                         elementwise=True)
 
     return output_func
 
@@ -257,43 +269,41 @@ def fillnan_aggregate(agg_fill_func=agg_mean()):
 
 
 def sampledown_mean():
-    agg_func = agg_mean()
-
-    func = functools.partial(agg_func._func)
+    func = _finite_only(numpy.mean)
     output_func = DownsampleFunction(func, 'downsample_mean')
 
     return output_func
 
 
 def sampledown_median():
-    agg_func = agg_median()
-
-    func = functools.partial(agg_func._func)
+    func = _finite_only(numpy.median)
     output_func = DownsampleFunction(func, 'downsample_median')
 
     return output_func
 
 
 def sampledown_max():
-    agg_func = agg_max()
-
-    func = functools.partial(agg_func._func)
+    func = _finite_only(numpy.max)
     output_func = DownsampleFunction(func, 'downsample_max')
 
     return output_func
 
 
 def sampledown_min():
-    agg_func = agg_min()
-
-    func = functools.partial(agg_func._func)
+    func = _finite_only(numpy.min)
     output_func = DownsampleFunction(func, 'downsample_min')
 
     return output_func
 
 
 def _remove_nan_inf(x):
-    x = x[~numpy.isnan(x)]
-    x = x[~numpy.isinf(x)]
+    return x[numpy.isfinite(x)]
+
+
+def _finite_only(func):
+    # Calls `func` directly on the finite values, skipping the extra
+    # partial/closure layers of the `agg_*` functions
+    def finite_func(x):
+        return func(_remove_nan_inf(x))
 
-    return x
+    return finite_func
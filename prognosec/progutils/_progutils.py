@@ -28,6 +28,7 @@ class Transformation:
         A string representation of the transformation functions to be applied,
         in order. If there are no functions, then `None` is returned
     """
+    __slots__ = ('_procedure',)
 
     def __init__(self):
         self._procedure = list()
@@ -38,10 +39,10 @@ class Transformation:
 
     @procedure.setter
     def procedure(self, proc):
-        if isinstance(proc, list) is not True:
+        if not isinstance(proc, list):
             raise TypeError("'proc' should be a list")
 
-        if callable_sequence(proc) is not True:
+        if not callable_sequence(proc):
             raise TypeError("'proc' should be a list of functions")
 
         self._procedure = proc
@@ -111,7 +112,7 @@ class Transformation:
         TypeError
             Usually raised because `func` is not a function
         """
-        if callable(func) is not True:
+        if not callable(func):
             raise TypeError("'func' should be a function")
 
         self.procedure.append(func)
@@ -231,12 +232,66 @@ class Transformation:
             returned. If `list` or `tuple`, then it is converted to a
             `numpy.ndarray`
         """
-        output = copy.deepcopy(data_series)
+        # Array copies are far cheaper than `copy.deepcopy`, which is only
+        # kept for input types without their own copy method
+        if isinstance(data_series,
+                      (numpy.ndarray, pandas.Series, pandas.DataFrame)):
+            output = data_series.copy()
+        elif is_tuple_or_list(data_series):
+            output = numpy.array(data_series)
+        else:
+            output = copy.deepcopy(data_series)
+
         for a_trans_fun in self.procedure:
             output = a_trans_fun(output)
 
         if is_tuple_or_list(data_series):
-            output = numpy.array(output)
+            output = numpy.asarray(output)
+
+        return output
+
+    def apply_batch(self, data_frame):
+        """Apply transformations onto many data series at once
+
+        Each column is treated as a data series. Functions flagged as
+        `elementwise` (e.g. `trans_log`) are applied to all columns in a single
+        call. All other functions are applied one column at a time, as they
+        may depend on the position of values within a series (e.g.
+        `trans_shift`). Functions receive `numpy.ndarray` inputs, and the
+        index and columns of a `pandas.DataFrame` are restored at the end.
+
+        Parameters
+        ----------
+        data_frame : pandas.DataFrame, numpy.ndarray
+            The data series to apply the transformations, with shape
+            `(nobs, nseries)`
+
+        Returns
+        -------
+        pandas.DataFrame, numpy.ndarray
+            A copy of the data series is returned, with the same type as
+            `data_frame`
+
+        Raises
+        ------
+        ValueError
+            `data_frame` is not 2-dimensional
+        """
+        output = numpy.array(data_frame)
+
+        if output.ndim != 2:
+            raise ValueError("'data_frame' should be 2-dimensional")
+
+        for a_trans_fun in self.procedure:
+            if getattr(a_trans_fun, 'elementwise', False):
+                output = a_trans_fun(output)
+            else:
+                output = numpy.column_stack(
+                    [a_trans_fun(i) for i in output.T])
+
+        if isinstance(data_frame, pandas.DataFrame):
+            output = pandas.DataFrame(output, index=data_frame.index,
+                                      columns=data_frame.columns)
 
         return output
 
@@ -262,12 +317,55 @@ def is_tuple_or_list(x):
 
 def isinstance_sequence(x, obj_type):
     """Test if all objects in `x` is of type `obj_type`"""
-    return all([isinstance(i, obj_type) for i in x])
+    return all(isinstance(i, obj_type) for i in x)
 
 
 def callable_sequence(x):
     """Test if all objects in `x` are callable (e.g. functions)"""
-    return all([callable(i) for i in x])
+    return all(callable(i) for i in x)
+
+
+def squared_error_stats(x, y):
+    """Mean and variance of the squared error between `x` and `y`
+
+    If both are `pandas.Series`, they are first aligned on their index and
+    only shared index values are compared. Otherwise values are compared
+    element-wise, and must have the same shape. Pairs with a missing value
+    are ignored.
+
+    Parameters
+    ----------
+    x, y : pandas.Series, numpy.ndarray, list, tuple
+
+    Returns
+    -------
+    tuple[float, float]
+        The mean and the (sample) variance of the squared errors. Either is
+        `NaN` if there are not enough values to compute it
+
+    Raises
+    ------
+    ValueError
+        `x` and `y` do not have the same shape
+    """
+    if isinstance(x, pandas.Series) and isinstance(y, pandas.Series):
+        x, y = x.align(y, join='inner')
+
+    x = numpy.asarray(x, dtype=numpy.float64)
+    y = numpy.asarray(y, dtype=numpy.float64)
+
+    if x.shape != y.shape:
+        raise ValueError(f"'x' and 'y' have different shapes, {x.shape} and "
+                         f"{y.shape}")
+
+    diff = numpy.subtract(x, y)
+    diff = diff[~numpy.isnan(diff)]
+    squared_error = numpy.square(diff, out=diff)
+
+    mean = squared_error.mean() if squared_error.size > 0 else numpy.nan
+    var = squared_error.var(ddof=1) if squared_error.size > 1 else numpy.nan
+
+    return mean, var
 
 
 def is_time_index(x):
@@ -395,7 +493,7 @@ def typecheck(**kwtypes):
             continue
         elif isinstance(types, tuple):
             for a_type in types:
-                if isinstance(a_type, type) is False:
+                if not isinstance(a_type, type):
                     msg = "Parameter '{0}' typecheck value '{1}' is not a type"
                     msg = msg.format(pname, a_type)
                     raise TypeError(msg)
@@ -430,10 +528,10 @@ def typecheck(**kwtypes):
                 except IndexError:
                     value = None
 
-                if param_was_provided is True:
-                    if isinstance(value, expected_types) is False:
+                if param_was_provided:
+                    if not isinstance(value, expected_types):
 
-                        if is_tuple_or_list(expected_types) is False:
+                        if not is_tuple_or_list(expected_types):
                             ex_types = [expected_types]
                         else:
                             ex_types = expected_types
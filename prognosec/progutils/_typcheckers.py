@@ -11,7 +11,7 @@ def typecheck(**kwtypes):
             continue
         elif isinstance(types, tuple):
             for a_type in types:
-                if isinstance(a_type, type) is False:
+                if not isinstance(a_type, type):
                     msg = "Parameter '{0}' typecheck value '{1}' is not a type"
                     msg = msg.format(pname, a_type)
                     raise TypeError(msg)
@@ -44,8 +44,8 @@ def typecheck(**kwtypes):
                 except IndexError:
                     value = None
 
-                if param_was_provided is True:
-                    if isinstance(value, expected_types) is not True:
+                if param_was_provided:
+                    if not isinstance(value, expected_types):
                         type_names = list()
 
                         for expected_type in expected_types:
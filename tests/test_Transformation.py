@@ -1,4 +1,5 @@
 import unittest
+import pickle
 from progutils import progutils
 from progutils import progfunc
 # from progutils import progexceptions
@@ -226,6 +227,83 @@ class TestTransformation(unittest.TestCase):
                            tranfunc2(tranfunc1(dat_series)))
         self.assertTrue(numpy.alltrue(series_all_true))
 
+    def test_apply_does_not_modify_input(self):
+        tmp = self.new_trans_obj()
+
+        def inplace_double(x):
+            x *= 2
+            return x
+
+        tmp.add(inplace_double)
+
+        dat_series = numpy.ones((10,), dtype=numpy.float64)
+        dat_pseries = pandas.Series(dat_series.copy())
+
+        self.assertTrue(numpy.all(tmp.apply(dat_series) == 2))
+        self.assertTrue(numpy.all(dat_series == 1))
+
+        self.assertTrue(pandas.Series.all(tmp.apply(dat_pseries) == 2))
+        self.assertTrue(pandas.Series.all(dat_pseries == 1))
+
+        dat_frame = pandas.DataFrame({'a': dat_series.copy()})
+        self.assertTrue((tmp.apply(dat_frame) == 2).all(axis=None))
+        self.assertTrue((dat_frame == 1).all(axis=None))
+
+    def test_apply_follows_procedure_changes(self):
+        tmp = self.new_trans_obj()
+        dat_series = numpy.array([1., 4., 9.])
+
+        tmp.add(numpy.sqrt)
+        self.assertTrue(numpy.all(tmp.apply(dat_series) == [1., 2., 3.]))
+
+        tmp.procedure.append(numpy.negative)
+        self.assertTrue(numpy.all(tmp.apply(dat_series) == [-1., -2., -3.]))
+
+        tmp.drop_first()
+        self.assertTrue(numpy.all(tmp.apply(dat_series) == [-1., -4., -9.]))
+
+        tmp.clear()
+        self.assertTrue(numpy.all(tmp.apply(dat_series) == dat_series))
+
+    def test_pickle_after_apply(self):
+        tmp = self.new_trans_obj()
+        tmp.add(numpy.sqrt)
+        dat_series = numpy.array([1., 4., 9.])
+        tmp.apply(dat_series)
+
+        restored = pickle.loads(pickle.dumps(tmp))
+
+        self.assertEqual(restored.size, 1)
+        self.assertTrue(numpy.all(restored.apply(dat_series) == [1., 2., 3.]))
+
+        restored.add(numpy.negative)
+        result = restored.apply(dat_series)
+        self.assertTrue(numpy.all(result == [-1., -2., -3.]))
+
+    def test_apply_batch_matches_apply(self):
+        tmp = self.new_trans_obj()
+        tmp.add(progfunc.trans_log())
+        tmp.add(progfunc.trans_shift(1))
+        tmp.add(progfunc.trans_inverse(add=1))
+
+        dat_array = numpy.arange(1, 21, dtype=numpy.float64).reshape(10, 2)
+        expected = numpy.column_stack([tmp.apply(i) for i in dat_array.T])
+
+        result = tmp.apply_batch(dat_array)
+        numpy.testing.assert_allclose(result, expected)
+        self.assertTrue(numpy.all(dat_array[0] == [1, 2]))
+
+        dat_frame = pandas.DataFrame(dat_array, columns=['a', 'b'],
+                                     index=range(10, 20))
+        result = tmp.apply_batch(dat_frame)
+        self.assertIsInstance(result, pandas.DataFrame)
+        self.assertTrue(result.index.equals(dat_frame.index))
+        self.assertEqual(list(result.columns), ['a', 'b'])
+        numpy.testing.assert_allclose(result.values, expected)
+
+        with self.assertRaises(ValueError):
+            tmp.apply_batch(numpy.ones(10))
+
 
 class TestInstanceCheckers(unittest.TestCase):
 
@@ -279,5 +357,47 @@ class TestInstanceCheckers(unittest.TestCase):
         self.assertFalse(callable_sequence([numpy.mean, 4]))
 
 
+class TestSquaredErrorStats(unittest.TestCase):
+
+    def test_array_input(self):
+        mse, var = progutils.squared_error_stats([1, 2, 3], [1, 4, 6])
+
+        self.assertAlmostEqual(mse, 13 / 3)
+        self.assertAlmostEqual(var, numpy.var([0, 4, 9], ddof=1))
+
+    def test_ignores_nan(self):
+        mse, var = progutils.squared_error_stats([1, numpy.nan, 3],
+                                                 [2, 2, numpy.nan])
+
+        self.assertEqual(mse, 1.0)
+        self.assertTrue(numpy.isnan(var))
+
+    def test_pandas_alignment(self):
+        index = pandas.period_range('2019-01-01', periods=4, name='date')
+        x = pandas.Series([1.0, 2.0, 3.0, 4.0], index=index)
+        y = pandas.Series([0.0, 1.0, 5.0], index=index[1:])
+
+        expected = (x - y).dropna().pow(2)
+        mse, var = progutils.squared_error_stats(x, y)
+
+        self.assertAlmostEqual(mse, expected.mean())
+        self.assertAlmostEqual(var, expected.var())
+
+    def test_no_overlap(self):
+        mse, var = progutils.squared_error_stats([numpy.nan], [1.0])
+
+        self.assertTrue(numpy.isnan(mse))
+        self.assertTrue(numpy.isnan(var))
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            progutils.squared_error_stats(
+                pandas.Series([1., 2., 3.]),
+                pandas.DataFrame({'a': [1., 2., 4.]}))
+
+        with self.assertRaises(ValueError):
+            progutils.squared_error_stats([1., 2., 3.], [1., 2.])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -89,3 +89,108 @@ class TestTransShiftFunction:
                     assert isinstance(trans_dat, pandas.Series)
                     assert trans_dat.name == 'x1'
                     assert trans_dat.index.name == 'date'
+
+
+class TestSampledownFunctions:
+
+    @pytest.fixture
+    def array_with_nan_inf(self):
+        return numpy.array([1.0, numpy.nan, 2.0, numpy.inf, 6.0, -numpy.inf])
+
+    def test_ignores_nan_inf(self, array_with_nan_inf):
+        x = array_with_nan_inf
+
+        assert progfunc.sampledown_mean()(x) == 3.0
+        assert progfunc.sampledown_median()(x) == 2.0
+        assert progfunc.sampledown_max()(x) == 6.0
+        assert progfunc.sampledown_min()(x) == 1.0
+
+    def test_matches_aggregate(self, array_with_nan_inf):
+        x = array_with_nan_inf
+
+        assert progfunc.sampledown_mean()(x) == progfunc.agg_mean()(x)
+        assert progfunc.sampledown_median()(x) == progfunc.agg_median()(x)
+
+    def test_pandas_input(self, array_with_nan_inf):
+        x = pandas.Series(array_with_nan_inf)
+
+        dsample_max = progfunc.sampledown_max()
+
+        assert progfunc.sampledown_mean()(x) == 3.0
+        assert dsample_max(x) == 6.0
+        assert isinstance(dsample_max, progfunc.DownsampleFunction)
+
+
+class TestTransformationFunctionRepr:
+
+    def test_str_no_params(self):
+        assert str(progfunc.trans_log()) == 'ln()'
+
+    def test_str_params(self):
+        assert str(progfunc.trans_inverse(add=2)) == 'inverse(add=2)'
+
+    def test_repr_subclass_name(self):
+        assert (repr(progfunc.sampledown_mean()) ==
+                '<DownsampleFunction: downsample_mean()>')
+        assert (repr(progfunc.trans_sqrt()) ==
+                '<TransformationFunction: sqrt()>')
+
+
+class TestTransInverseFunction:
+
+    def test_sequence_input(self):
+        trans_dat = progfunc.trans_inverse(add=1)([1, 3, 4])
+
+        assert isinstance(trans_dat, numpy.ndarray)
+        assert numpy.allclose(trans_dat, [0.5, 0.25, 0.2])
+
+    def test_integer_array_input(self):
+        og_array = numpy.arange(1, 5)
+        trans_dat = progfunc.trans_inverse()(og_array)
+
+        assert numpy.allclose(trans_dat, 1 / og_array)
+        # Input array is left untouched
+        assert numpy.array_equal(og_array, numpy.arange(1, 5))
+
+    def test_pandas_input(self):
+        index = pandas.period_range('2019-01-01', periods=4, name='date')
+        og_series = pandas.Series([1.0, 2.0, 4.0, 8.0], index=index,
+                                  name='x1')
+        trans_dat = progfunc.trans_inverse()(og_series)
+
+        assert isinstance(trans_dat, pandas.Series)
+        assert trans_dat.name == 'x1'
+        assert trans_dat.index.name == 'date'
+        assert numpy.allclose(trans_dat, [1.0, 0.5, 0.25, 0.125])
+        assert og_series.iloc[0] == 1.0
+
+    def test_dataframe_input(self):
+        og_frame = pandas.DataFrame({'a': [1.0, 2.0], 'b': [4.0, 8.0]},
+                                    index=['x', 'y'])
+        trans_dat = progfunc.trans_inverse()(og_frame)
+
+        assert isinstance(trans_dat, pandas.DataFrame)
+        assert list(trans_dat.columns) == ['a', 'b']
+        assert list(trans_dat.index) == ['x', 'y']
+        assert numpy.allclose(trans_dat, [[1.0, 0.25], [0.5, 0.125]])
+
+    def test_float32_input(self):
+        og_array = numpy.array([1.0, 2.0, 4.0], dtype=numpy.float32)
+        trans_dat = progfunc.trans_inverse(add=1)(og_array)
+
+        assert trans_dat.dtype == numpy.float32
+        assert numpy.allclose(trans_dat, [0.5, 1 / 3, 0.2])
+        assert numpy.array_equal(og_array, [1.0, 2.0, 4.0])
+
+    def test_scalar_input(self):
+        trans_dat = progfunc.trans_inverse()(2)
+
+        assert not isinstance(trans_dat, numpy.ndarray)
+        assert trans_dat == 0.5
+
+    def test_pandas_index_input(self):
+        og_index = pandas.Index([1.0, 2.0, 4.0])
+        trans_dat = progfunc.trans_inverse()(og_index)
+
+        assert isinstance(trans_dat, pandas.Index)
+        assert numpy.allclose(trans_dat, [1.0, 0.5, 0.25])
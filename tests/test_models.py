@@ -0,0 +1,127 @@
+import pytest
+import pandas
+import numpy
+
+# `models` needs `statsmodels` and `prognosec.timeseries`
+models = pytest.importorskip('models')
+
+
+class BusinessDayCalendar:
+    def __init__(self, weekdays=(0, 1, 2, 3, 4)):
+        self.weekdays = weekdays
+        self.calls = 0
+
+    def valid_days(self, start, end, tz=None):
+        self.calls += 1
+        days = pandas.date_range(start, end, tz=tz)
+
+        return days[days.weekday.isin(self.weekdays)]
+
+
+class NoFolds:
+    def split(self):
+        return iter(())
+
+
+class TestNumWorkers:
+
+    def test_sequential_default(self):
+        assert models._num_workers(None, 10) == 1
+        assert models._num_workers(1, 10) == 1
+
+    def test_capped_by_tasks(self):
+        assert models._num_workers(8, 3) == 3
+        assert models._num_workers(8, 0) == 1
+
+    def test_negative_counts_from_cpus(self, monkeypatch):
+        monkeypatch.setattr(models.os, 'cpu_count', lambda: 4)
+
+        assert models._num_workers(-1, 10) == 4
+        assert models._num_workers(-2, 10) == 3
+        assert models._num_workers(-10, 10) == 1
+
+
+class TestFitKey:
+
+    @pytest.fixture
+    def data(self):
+        index = pandas.bdate_range('2019-01-01', periods=5, name='date')
+
+        return pandas.DataFrame({'x1': numpy.arange(5.0)}, index=index)
+
+    def test_same_data_same_key(self, data):
+        assert (models._fit_key(data, (1, 0, 0)) ==
+                models._fit_key(data.copy(), [1, 0, 0]))
+
+    def test_key_changes(self, data):
+        key = models._fit_key(data, (1, 0, 0))
+
+        changed = data.copy()
+        changed.iloc[0, 0] = 10.0
+
+        assert models._fit_key(changed, (1, 0, 0)) != key
+        assert models._fit_key(data, (0, 1, 0)) != key
+        assert models._fit_key(data.rename(columns={'x1': 'x2'}),
+                               (1, 0, 0)) != key
+        assert models._fit_key(data.shift(1, freq='B'), (1, 0, 0)) != key
+
+
+class TestFitCache:
+
+    def test_off_by_default(self):
+        models.clear_fit_cache()
+        models._cache_fit_result('key', ('fitted', True))
+
+        assert 'key' not in models._ARIMA_FIT_CACHE
+
+    def test_least_recently_used_evicted(self, monkeypatch):
+        monkeypatch.setattr(models, 'ARIMA_FIT_CACHE_SIZE', 2)
+        models.clear_fit_cache()
+
+        models._cache_fit_result('a', 1)
+        models._cache_fit_result('b', 2)
+        assert models._cached_fit_result('a') == 1
+
+        models._cache_fit_result('c', 3)
+        assert list(models._ARIMA_FIT_CACHE) == ['a', 'c']
+
+        models.clear_fit_cache()
+        assert not models._ARIMA_FIT_CACHE
+
+
+class TestForecastIndex:
+
+    def test_business_days(self):
+        start = pandas.Timestamp('2019-01-04')
+        result = models._forecast_index(BusinessDayCalendar(), start, 3, None)
+
+        expected = pandas.to_datetime(['2019-01-04', '2019-01-07',
+                                       '2019-01-08'])
+        assert result.equals(pandas.DatetimeIndex(expected))
+
+    def test_search_widened(self):
+        # Only Mondays are valid, so the first search span is too short
+        calendar = BusinessDayCalendar(weekdays=(0,))
+        start = pandas.Timestamp('2019-01-01')
+        result = models._forecast_index(calendar, start, 5, None)
+
+        assert len(result) == 5
+        assert (result.weekday == 0).all()
+        assert calendar.calls > 1
+
+
+class TestCvTimeseries:
+
+    def test_no_folds(self):
+        result = models.cv_timeseries(NoFolds(), models.RandomWalk)
+
+        assert result.empty
+        assert list(result.columns) == [i for i, _ in models._CV_COLUMNS]
+        assert result['k'].dtype == numpy.int64
+        assert result['mse'].dtype == numpy.float64
+
+    def test_no_folds_parallel(self):
+        result = models.cv_timeseries(NoFolds(), models.RandomWalk,
+                                      fold_jobs=2)
+
+        assert result.empty